@@ -5,7 +5,7 @@ Provides utilities for extracting and testing Solution classes from Jupyter note
 
 import json
 from pathlib import Path
-from typing import Type
+from typing import Callable, Type
 
 
 class NotebookSolutionLoader:
@@ -23,30 +23,53 @@ class NotebookSolutionLoader:
         Returns:
             Requested class or None if not found
         """
+        return NotebookSolutionLoader._load_definition(
+            notebook_path, class_name, f'class {class_name}'
+        )
+
+    @staticmethod
+    def load_function_from_notebook(notebook_path: str, function_name: str) -> Callable:
+        """
+        Load a top-level function from a Jupyter notebook.
+        
+        Args:
+            notebook_path: Path to the .ipynb file
+            function_name: Name of the function to load
+            
+        Returns:
+            Requested function or None if not found
+        """
+        return NotebookSolutionLoader._load_definition(
+            notebook_path, function_name, f'def {function_name}('
+        )
+
+    @staticmethod
+    def _load_definition(notebook_path: str, name: str, marker: str):
+        """Execute code cells up to the one containing marker and return name."""
         try:
             with open(notebook_path, 'r', encoding='utf-8') as f:
                 notebook = json.load(f)
             
-            class_code = []
-            found_class = False
+            code = []
+            found = False
             for cell in notebook.get('cells', []):
                 if cell.get('cell_type') == 'code':
                     source = ''.join(cell.get('source', []))
-                    class_code.append(source)
-                    if f'class {class_name}' in source:
-                        found_class = True
+                    code.append(source)
+                    if marker in source:
+                        found = True
                         break
             
-            if not found_class:
+            if not found:
                 return None
             
-            # Execute the combined code to get the requested class.
+            # Execute the combined code to get the requested definition.
             namespace = {}
-            exec('\n'.join(class_code), namespace)
-            return namespace.get(class_name)
+            exec('\n'.join(code), namespace)
+            return namespace.get(name)
         
         except Exception as e:
-            print(f"Error loading {class_name} from {notebook_path}: {e}")
+            print(f"Error loading {name} from {notebook_path}: {e}")
             return None
 
     @staticmethod
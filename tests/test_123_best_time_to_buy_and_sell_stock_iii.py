@@ -0,0 +1,308 @@
+"""
+Unit tests for 123. Best Time to Buy and Sell Stock III (LeetCode)
+
+Tests the Solution class extracted from the Jupyter notebook.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from .conftest import NotebookSolutionLoader
+
+
+def reference_max_profit(k, prices):
+    """Scalar at-most-k-transactions DP, one layer at a time."""
+    buy = [float("-inf")] * (k + 1)
+    sell = [0] * (k + 1)
+    for price in prices:
+        for j in range(1, k + 1):
+            buy[j] = max(buy[j], sell[j - 1] - price)
+            sell[j] = max(sell[j], buy[j] + price)
+    return sell[k]
+
+
+class TestBestTimeToBuyAndSellStockIII:
+    """Test suite for the two-transaction maxProfit solution."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("123. Best Time to Buy and Sell Stock III.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+
+    def test_leetcode_examples(self, solution):
+        """LeetCode examples for two transactions."""
+        assert solution.maxProfit([3, 3, 5, 0, 0, 3, 1, 4]) == 6
+        assert solution.maxProfit([1, 2, 3, 4, 5]) == 4
+        assert solution.maxProfit([7, 6, 4, 3, 1]) == 0
+
+    def test_short_inputs(self, solution):
+        """Fewer than two days cannot make a profit."""
+        assert solution.maxProfit([]) == 0
+        assert solution.maxProfit([5]) == 0
+
+    def test_takes_best_two_of_three(self, solution):
+        """Only the two best trades count."""
+        assert solution.maxProfit([1, 5, 1, 5, 1, 5]) == 8
+
+
+class TestMaxProfitK:
+    """Test suite for the k-transaction maxProfit_k engine."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("123. Best Time to Buy and Sell Stock III.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+
+    def test_k_equal_two_matches_max_profit(self, solution):
+        """k = 2 agrees with the hard-coded two-transaction DP."""
+        rng = random.Random(3)
+        for _ in range(200):
+            prices = [rng.randint(0, 30) for _ in range(rng.randint(0, 15))]
+            assert solution.maxProfit_k(2, prices) == solution.maxProfit(prices)
+
+    def test_matches_reference(self, solution):
+        """Vectorized layers match the scalar DP for many k."""
+        rng = random.Random(4)
+        for _ in range(200):
+            prices = [rng.randint(0, 30) for _ in range(rng.randint(0, 15))]
+            k = rng.randint(0, 8)
+            assert solution.maxProfit_k(k, prices) == reference_max_profit(k, prices)
+
+    def test_unlimited_transactions(self, solution):
+        """Large k falls back to summing every rising day."""
+        prices = [1, 3, 2, 5, 4, 8]
+        assert solution.maxProfit_k(3, prices) == 9
+        assert solution.maxProfit_k(100, prices) == 9
+
+    def test_float_prices(self, solution):
+        """Fractional tick prices are not truncated on any path."""
+        assert solution.maxProfit_k(1, [1.5, 2.7, 1.0]) == pytest.approx(1.2)
+        prices = [1.5, 2.7, 1.0, 3.9, 0.2, 0.9]
+        assert solution.maxProfit_k(1, prices) == pytest.approx(2.9)
+        assert solution.maxProfit_k(2, prices) == pytest.approx(solution.maxProfit(prices))
+        assert solution.maxProfit_sweep(2, prices).tolist() == pytest.approx([2.9, 4.1])
+
+    def test_unsigned_prices(self, solution):
+        """Unsigned price arrays do not wrap around on falling days."""
+        for dtype in (np.uint8, np.uint32):
+            prices = np.array([1, 5, 2, 8], dtype=dtype)
+            assert solution.maxProfit_k(2, prices) == 10
+            assert solution.maxProfit_k(1, prices) == 7
+
+    def test_zero_transactions(self, solution):
+        """No transactions means no profit."""
+        assert solution.maxProfit_k(0, [1, 5]) == 0
+
+    def test_sweep_returns_every_k(self, solution):
+        """The sweep returns the best profit for each k from 1 to max_k."""
+        prices = [3, 8, 1, 9, 2, 7, 4, 6]
+        profits = solution.maxProfit_sweep(6, prices)
+        assert profits.tolist() == [reference_max_profit(k, prices) for k in range(1, 7)]
+
+
+class TestMaxProfitBatch:
+    """Test suite for the multi-instrument batch driver."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("123. Best Time to Buy and Sell Stock III.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+
+    @pytest.fixture
+    def prices(self):
+        """Forty days of prices for twelve instruments."""
+        return np.random.default_rng(8).integers(0, 50, size=(40, 12))
+
+    def expected(self, solution, prices):
+        return [solution.maxProfit(prices[:, column].tolist()) for column in range(prices.shape[1])]
+
+    def test_columns_match_max_profit(self, solution, prices):
+        """Every column gets the same profit as maxProfit on its own."""
+        assert solution.maxProfit_batch(prices, block_days=7).tolist() == self.expected(solution, prices)
+
+    def test_single_day(self, solution):
+        """A single day of prices makes no profit anywhere."""
+        assert solution.maxProfit_batch(np.array([[3, 1, 2]])).tolist() == [0, 0, 0]
+
+    def test_npy_file(self, solution, prices, tmp_path):
+        """Columns are read from a memory-mapped .npy file."""
+        np.save(tmp_path / "prices.npy", prices)
+        profits = solution.maxProfit_file(tmp_path / "prices.npy")
+        assert profits.tolist() == self.expected(solution, prices)
+
+    def test_raw_file_with_workers(self, solution, prices, tmp_path):
+        """Columns split across worker processes give the same result."""
+        prices.astype(np.float64).tofile(tmp_path / "prices.bin")
+        profits = solution.maxProfit_file(
+            tmp_path / "prices.bin", shape=prices.shape, dtype=np.float64, workers=3
+        )
+        assert profits.tolist() == self.expected(solution, prices)
+
+    def test_raw_file_needs_shape(self, solution, prices, tmp_path):
+        """A raw file without a shape is rejected instead of read as one row."""
+        prices.astype(np.float64).tofile(tmp_path / "prices.bin")
+        with pytest.raises(ValueError):
+            solution.maxProfit_file(tmp_path / "prices.bin")
+
+    def test_file_must_be_2d(self, solution, prices, tmp_path):
+        """Files that do not hold a (days, instruments) array are rejected."""
+        np.save(tmp_path / "prices.npy", prices[:, 0])
+        with pytest.raises(ValueError):
+            solution.maxProfit_file(tmp_path / "prices.npy")
+
+
+class TestMaxProfitIndex:
+    """Test suite for windowed queries through the max-plus segment tree."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("123. Best Time to Buy and Sell Stock III.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture(scope="class")
+    def index_class(self):
+        """Load MaxProfitIndex class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("123. Best Time to Buy and Sell Stock III.ipynb")
+        index = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "MaxProfitIndex")
+        assert index is not None, "Failed to load MaxProfitIndex class from notebook"
+        return index
+
+    @staticmethod
+    def final_states(prices):
+        """Final (buy1, sell1, buy2, sell2) of the scalar DP."""
+        buy1, sell1, buy2, sell2 = float("-inf"), 0, float("-inf"), 0
+        for price in prices:
+            buy1 = max(buy1, -price)
+            sell1 = max(sell1, buy1 + price)
+            buy2 = max(buy2, sell1 - price)
+            sell2 = max(sell2, buy2 + price)
+        return buy1, sell1, buy2, sell2
+
+    def test_full_window(self, index_class):
+        """The whole series gives the LeetCode answer."""
+        index = index_class([3, 3, 5, 0, 0, 3, 1, 4])
+        assert index.query(0, 7) == 6
+
+    def test_sub_windows(self, index_class):
+        """Windows only trade on their own days."""
+        index = index_class([3, 3, 5, 0, 0, 3, 1, 4])
+        assert index.query(0, 2) == 2
+        assert index.query(3, 7) == 6
+        assert index.query(5, 6) == 0
+        assert index.query(4, 4) == 0
+
+    def test_matches_scalar_dp(self, solution_class, index_class):
+        """Random windows match maxProfit and the final DP states."""
+        rng = random.Random(9)
+        for _ in range(50):
+            prices = [rng.randint(0, 40) for _ in range(rng.randint(1, 30))]
+            index = index_class(prices)
+            for _ in range(10):
+                l = rng.randrange(len(prices))
+                r = rng.randrange(l, len(prices))
+                window = prices[l:r + 1]
+                assert index.states(l, r) == self.final_states(window)
+                assert index.query(l, r) == solution_class().maxProfit(window)
+
+    def test_large_integer_prices_stay_exact(self, index_class):
+        """Integer prices past 2**53 are not rounded through float64."""
+        assert index_class([1, 2 ** 60 + 3]).query(0, 1) == 2 ** 60 + 2
+        rng = random.Random(11)
+        prices = [rng.randint(0, 2 ** 60) for _ in range(40)]
+        index = index_class(prices)
+        for _ in range(20):
+            l = rng.randrange(len(prices))
+            r = rng.randrange(l, len(prices))
+            assert index.states(l, r) == self.final_states(prices[l:r + 1])
+
+
+class TestStateTracing:
+    """Test suite for the memory-bounded state tracing helpers."""
+
+    NOTEBOOK = "123. Best Time to Buy and Sell Stock III.ipynb"
+    PRICES = [3, 3, 5, 0, 0, 3, 1, 4]
+
+    @pytest.fixture(scope="class")
+    def load(self):
+        """Load a top-level function from the notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook(self.NOTEBOOK)
+
+        def load_function(name):
+            function = NotebookSolutionLoader.load_function_from_notebook(notebook_path, name)
+            assert function is not None, f"Failed to load {name} from notebook"
+            return function
+
+        return load_function
+
+    def test_iter_states_is_lazy(self, load):
+        """Rows are produced on demand, so unbounded inputs can be traced."""
+        iter_states = load("iter_states")
+        rows = iter_states(iter(range(10**12)))
+        assert next(rows) == (0, 0, 0, 0, 0, 0)
+
+    def test_iter_states_sampling(self, load):
+        """Only every Nth day is yielded."""
+        iter_states = load("iter_states")
+        days = [row[0] for row in iter_states(self.PRICES, every=3)]
+        assert days == [0, 3, 6]
+
+    def test_trace_states_defaults(self, load):
+        """Without options every day is returned with the final profit."""
+        rows, sell2 = load("trace_states")(self.PRICES)
+        assert len(rows) == len(self.PRICES)
+        assert rows[-1] == (7, 4, 0, 4, 2, 6)
+        assert sell2 == 6
+
+    def test_trace_states_ring_buffer(self, load):
+        """keep_last bounds the rows kept, but the final profit covers every day."""
+        rows, sell2 = load("trace_states")(self.PRICES, every=2, keep_last=2)
+        assert [row[0] for row in rows] == [4, 6]
+        assert sell2 == 6
+
+    def test_write_states_csv(self, load, tmp_path):
+        """Sampled rows are streamed to a CSV file."""
+        path = tmp_path / "states.csv"
+        assert load("write_states_csv")(self.PRICES, path, every=4) == 6
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines == ["day,price,buy1,sell1,buy2,sell2", "0,3,-3,0,-3,0", "4,0,0,2,2,2"]
+
+    def test_write_states_binary(self, load, tmp_path):
+        """Rows are streamed as fixed-size records in batches."""
+        path = tmp_path / "states.bin"
+        assert load("write_states_binary")(self.PRICES, path, batch_rows=3) == 6
+
+        record = np.dtype([("day", "<i8")] + [
+            (name, "<f8") for name in ("price", "buy1", "sell1", "buy2", "sell2")
+        ])
+        records = np.fromfile(path, dtype=record)
+        assert records["day"].tolist() == list(range(len(self.PRICES)))
+        assert records["sell2"].tolist() == [0, 0, 2, 2, 2, 5, 5, 6]
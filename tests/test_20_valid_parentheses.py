@@ -0,0 +1,178 @@
+"""
+Unit tests for 20. Valid Parentheses (LeetCode)
+
+Tests the Solution class extracted from the Jupyter notebook.
+"""
+
+import random
+
+import pytest
+from .conftest import NotebookSolutionLoader
+
+
+class TestValidParentheses:
+    """Test suite for the in-memory isValid solution."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("20. Valid Parentheses.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+
+    def test_leetcode_examples(self, solution):
+        """LeetCode examples."""
+        assert solution.isValid("()") is True
+        assert solution.isValid("()[]{}") is True
+        assert solution.isValid("(]") is False
+        assert solution.isValid("([])") is True
+
+    def test_unbalanced(self, solution):
+        """Unclosed openers and stray closers are invalid."""
+        assert solution.isValid("((") is False
+        assert solution.isValid("())") is False
+        assert solution.isValid("]") is False
+
+
+class TestBracketStream:
+    """Test suite for the chunked, resumable streaming validator."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("20. Valid Parentheses.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture(scope="class")
+    def stream_class(self):
+        """Load BracketStream class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("20. Valid Parentheses.ipynb")
+        stream = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "BracketStream")
+        assert stream is not None, "Failed to load BracketStream class from notebook"
+        return stream
+
+    def test_skips_non_bracket_bytes(self, solution_class):
+        """Text around the brackets is ignored."""
+        assert solution_class().isValid_stream([b"cfg = {a: [1, (2)]}", b"\n# done\n"]) is True
+
+    def test_matches_is_valid_for_any_chunking(self, solution_class):
+        """Chunked validation agrees with isValid on bracket-only strings."""
+        rng = random.Random(20)
+        for _ in range(500):
+            s = "".join(rng.choice("()[]{}") for _ in range(rng.randint(0, 12)))
+            data = s.encode()
+            size = rng.randint(1, 5)
+            chunks = [data[i:i + size] for i in range(0, len(data), size)]
+            assert solution_class().isValid_stream(chunks) == solution_class().isValid(s)
+
+    def test_error_offset_across_chunks(self, stream_class):
+        """The offset of the first bad closer counts bytes of earlier chunks."""
+        stream = stream_class()
+        assert stream.feed(b"ab(c[d") is True
+        assert stream.feed(b"]x)y}z") is False
+        assert stream.error_offset == 10
+        assert stream.finish() is False
+
+    def test_error_offset_inside_collapsed_pairs(self, stream_class):
+        """Errors are located even after matched pairs were dropped in bulk."""
+        stream = stream_class()
+        assert stream.feed(b"(()[]{})  ([)]") is False
+        assert stream.error_offset == 12
+
+    def test_unclosed_reported_at_end(self, stream_class):
+        """Brackets left open are reported at the end of the input."""
+        stream = stream_class()
+        stream.feed(b"x(")
+        stream.feed(memoryview(b"[y]"))
+        assert stream.finish() is False
+        assert stream.error_offset == 5
+
+    def test_file_resume(self, stream_class, tmp_path):
+        """feed_file continues from the offset of an earlier partial run."""
+        path = tmp_path / "config.txt"
+        path.write_bytes(b"{ a: [1, 2], b: (3) }\n" * 100)
+
+        stream = stream_class()
+        stream.feed(path.read_bytes()[:1001])
+        assert stream.stack
+
+        assert stream.feed_file(path, chunk_size=64) is True
+        assert stream.offset == 2200
+        assert stream.finish() is True
+
+    def test_is_valid_file(self, solution_class, tmp_path):
+        """isValid_file reads the whole file in chunks."""
+        path = tmp_path / "broken.txt"
+        path.write_bytes(b"[" * 1000 + b"]" * 999 + b")")
+        assert solution_class().isValid_file(path, chunk_size=128) is False
+
+
+class TestParallelValidation:
+    """Test suite for chunk summaries and the multi-process validator."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("20. Valid Parentheses.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture(scope="class")
+    def stream_class(self):
+        """Load BracketStream class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("20. Valid Parentheses.ipynb")
+        stream = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "BracketStream")
+        assert stream is not None, "Failed to load BracketStream class from notebook"
+        return stream
+
+    def test_summarize(self, stream_class):
+        """A chunk keeps only its unmatched closers and openers."""
+        assert stream_class.summarize(b"a)](x)[{") == (b")]", b"[{")
+        assert stream_class.summarize(b"(]") is None
+
+    def test_combine_matches_across_chunks(self, stream_class):
+        """Openers on the left close against closers on the right."""
+        left = stream_class.summarize(b"{[(")
+        right = stream_class.summarize(b")]}")
+        assert stream_class.combine(left, right) == (b"", b"")
+        assert stream_class.combine(left, stream_class.summarize(b")}")) is None
+
+    def test_combine_is_associative(self, stream_class):
+        """Any grouping of chunk summaries gives the same result."""
+        rng = random.Random(12)
+        for _ in range(300):
+            a, b, c = (
+                "".join(rng.choice("()[]{}") for _ in range(rng.randint(0, 6))).encode()
+                for _ in range(3)
+            )
+            sa, sb, sc = (stream_class.summarize(part) for part in (a, b, c))
+            left_first = stream_class.combine(stream_class.combine(sa, sb), sc)
+            right_first = stream_class.combine(sa, stream_class.combine(sb, sc))
+            assert left_first == right_first == stream_class.summarize(a + b + c)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_parallel_file(self, solution_class, tmp_path, workers):
+        """Splitting the file across workers gives the serial answer."""
+        valid = tmp_path / "valid.txt"
+        valid.write_bytes(b"{ a: [1, (2)], b: {c: [3]} }\n" * 200)
+        broken = tmp_path / "broken.txt"
+        broken.write_bytes(b"(" * 300 + b"]" + b")" * 299)
+
+        solution = solution_class()
+        assert solution.isValid_parallel(valid, workers=workers, chunk_size=256) is True
+        assert solution.isValid_parallel(broken, workers=workers, chunk_size=64) is False
+
+    def test_worker_failure_is_raised(self, solution_class, tmp_path):
+        """A worker that fails reports back instead of leaving the parent waiting."""
+        solution = solution_class()
+        with pytest.raises((RuntimeError, OSError)):
+            solution.isValid_parallel(tmp_path, workers=2, chunk_size=16)
@@ -0,0 +1,220 @@
+"""
+Unit tests for 31. Next Permutation (LeetCode)
+
+Tests the Solution class extracted from the Jupyter notebook.
+Covers single steps, the in-place generator and k-step jumps.
+"""
+
+import math
+import random
+from itertools import permutations
+
+import pytest
+
+from .conftest import NotebookSolutionLoader
+
+
+class TestNextPermutation:
+    """Test suite for single-step nextPermutation."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("31. Next Permutation.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_leetcode_examples(self, solution):
+        """Examples from the problem statement."""
+        for nums, expected in [([1, 2, 3], [1, 3, 2]), ([3, 2, 1], [1, 2, 3]), ([1, 1, 5], [1, 5, 1])]:
+            solution.nextPermutation(nums)
+            assert nums == expected
+    
+    def test_single_and_empty(self, solution):
+        """Lists with fewer than two elements stay unchanged."""
+        for nums in [[], [7]]:
+            expected = nums[:]
+            solution.nextPermutation(nums)
+            assert nums == expected
+    
+    def test_matches_itertools_order(self, solution):
+        """Repeated steps walk every permutation in lexicographic order."""
+        nums = [1, 2, 3, 4, 5]
+        for expected in permutations([1, 2, 3, 4, 5]):
+            assert tuple(nums) == expected
+            solution.nextPermutation(nums)
+        assert nums == [1, 2, 3, 4, 5]
+
+
+class TestPermutationGenerator:
+    """Test suite for the in-place permutation generator."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("31. Next Permutation.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_yields_all_permutations_in_order(self, solution):
+        """From the first permutation every permutation is yielded once."""
+        seen = [tuple(p) for p in solution.iter_permutations([1, 2, 3, 4])]
+        assert seen == list(permutations([1, 2, 3, 4]))
+    
+    def test_yields_same_list_in_place(self, solution):
+        """The generator permutes and yields the caller's list."""
+        nums = [1, 2, 3]
+        assert all(p is nums for p in solution.iter_permutations(nums))
+        assert nums == [3, 2, 1]
+    
+    def test_starts_mid_sequence_without_wrapping(self, solution):
+        """Iteration starts at nums and stops at the last permutation."""
+        seen = [p[:] for p in solution.iter_permutations([2, 3, 1])]
+        assert seen == [[2, 3, 1], [3, 1, 2], [3, 2, 1]]
+    
+    def test_count_limits_and_leaves_last_yielded(self, solution):
+        """count caps the permutations yielded and nums stays at the last one."""
+        nums = [1, 2, 3, 4]
+        seen = [p[:] for p in solution.iter_permutations(nums, count=3)]
+        assert seen == [[1, 2, 3, 4], [1, 2, 4, 3], [1, 3, 2, 4]]
+        assert nums == [1, 3, 2, 4]
+        assert list(solution.iter_permutations(nums, count=0)) == []
+    
+    def test_duplicates_yield_distinct_permutations(self, solution):
+        """Multisets yield each distinct arrangement once."""
+        seen = [tuple(p) for p in solution.iter_permutations([1, 1, 2, 2])]
+        assert seen == sorted(set(permutations([1, 1, 2, 2])))
+
+
+class TestAdvance:
+    """Test suite for jumping k permutations ahead."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("31. Next Permutation.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_matches_repeated_next_permutation(self, solution):
+        """advance(k) equals k calls to nextPermutation, wrapping included."""
+        rng = random.Random(16)
+        for _ in range(200):
+            nums = rng.sample(range(10), rng.randint(0, 6))
+            k = rng.randint(0, 2 * math.factorial(len(nums)))
+            expected = nums[:]
+            for _ in range(k):
+                solution.nextPermutation(expected)
+            solution.advance(nums, k)
+            assert nums == expected
+    
+    def test_shard_starts(self, solution):
+        """Shards started with advance cover the space exactly once."""
+        shards = []
+        for worker in range(4):
+            nums = [1, 2, 3, 4, 5]
+            solution.advance(nums, worker * 30)
+            shards.extend(tuple(p) for p in solution.iter_permutations(nums, count=30))
+        assert shards == list(permutations([1, 2, 3, 4, 5]))
+    
+    def test_large_list_small_jump(self, solution):
+        """Small jumps only rewrite a short suffix of a long list."""
+        nums = list(range(10000))
+        solution.advance(nums, 5)
+        assert nums[:9997] == list(range(9997))
+        assert nums[9997:] == [9999, 9998, 9997]
+    
+    def test_huge_jump(self, solution):
+        """Jumps far beyond what stepping could reach land on the right permutation."""
+        nums = list(range(20))
+        solution.advance(nums, math.factorial(20) - 1)
+        assert nums == list(range(19, -1, -1))
+    
+    def test_rejects_bad_input(self, solution):
+        """Negative jumps and repeated values are rejected."""
+        with pytest.raises(ValueError):
+            solution.advance([1, 2, 3], -1)
+        with pytest.raises(ValueError):
+            solution.advance([1, 1, 2], 10)
+
+
+class TestRankUnrank:
+    """Test suite for permutation ranks backed by a Fenwick tree."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("31. Next Permutation.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_ranks_follow_lexicographic_order(self, solution):
+        """Every permutation of distinct values ranks at its itertools position."""
+        for expected, nums in enumerate(permutations([0, 1, 2, 3, 4])):
+            assert solution.rank(list(nums)) == expected
+            assert solution.unrank(5, expected) == list(nums)
+    
+    def test_multiset_ranks(self, solution):
+        """Repeated values rank among the distinct arrangements only."""
+        arrangements = sorted(set(permutations([1, 1, 2, 3, 3, 3])))
+        assert len(arrangements) == 60
+        for expected, nums in enumerate(arrangements):
+            assert solution.rank(list(nums)) == expected
+            assert solution.unrank(6, expected, [3, 1, 3, 2, 1, 3]) == list(nums)
+    
+    def test_round_trip_large_n(self, solution):
+        """Rank and unrank are inverses for n in the thousands."""
+        rng = random.Random(17)
+        nums = [rng.randrange(500) for _ in range(3000)]
+        r = solution.rank(nums)
+        assert solution.unrank(len(nums), r, nums) == nums
+    
+    def test_extreme_ranks(self, solution):
+        """The sorted list ranks 0 and the reversed list ranks last."""
+        n = 2000
+        assert solution.rank(list(range(n))) == 0
+        assert solution.rank(list(range(n - 1, -1, -1))) == math.factorial(n) - 1
+        assert solution.unrank(n, math.factorial(n) - 1) == list(range(n - 1, -1, -1))
+    
+    def test_consistent_with_advance(self, solution):
+        """advance(k) moves the rank by k."""
+        nums = list(range(12))
+        random.Random(7).shuffle(nums)
+        r = solution.rank(nums)
+        solution.advance(nums, 12345)
+        assert solution.rank(nums) == r + 12345
+    
+    def test_empty_and_invalid(self, solution):
+        """Empty input has one permutation; bad ranks and sizes are rejected."""
+        assert solution.rank([]) == 0
+        assert solution.unrank(0, 0) == []
+        with pytest.raises(ValueError):
+            solution.unrank(3, 6)
+        with pytest.raises(ValueError):
+            solution.unrank(3, -1)
+        with pytest.raises(ValueError):
+            solution.unrank(3, 0, [1, 2])
@@ -4,6 +4,9 @@ Unit tests for 42. Trapping Rain Water (LeetCode)
 Tests the Solution class extracted from the Jupyter notebook.
 """
 
+import random
+
+import numpy as np
 import pytest
 from .conftest import NotebookSolutionLoader
 
@@ -100,6 +103,401 @@ class TestTrappingRainWater:
         assert solution.trap([2, 2, 2, 2]) == 0
 
 
+class TestTwoPointerEngine:
+    """Test suite for the linear two-pointer engine of trap."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @staticmethod
+    def pool_records(pools):
+        return [
+            (
+                pool["index"],
+                pool["left_wall"],
+                pool["right_wall"],
+                pool["relative_depth"],
+                pool["nr_of_filled_blocks"],
+                pool["contained_indices"],
+                pool["value"],
+            )
+            for pool in pools
+        ]
+
+    def test_basic_examples(self, solution_class):
+        """Both LeetCode examples give the expected volume."""
+        solution = solution_class()
+        assert solution.trap([0, 1, 0, 2, 1, 0, 1, 3, 2, 1, 2, 1], engine="two_pointer") == 6
+        assert solution.trap([4, 2, 0, 3, 2, 5], engine="two_pointer") == 9
+
+    def test_edge_cases(self, solution_class):
+        """Empty, single and flat inputs trap nothing and create no pools."""
+        solution = solution_class()
+        for height in ([], [3], [2, 2, 2], [0, 1, 2, 3], [3, 2, 1, 0]):
+            assert solution.trap(height, engine="two_pointer") == 0
+            assert solution.pools == []
+
+    def test_pools_are_ordered_left_to_right(self, solution_class):
+        """Pools are reported from the leftmost to the rightmost."""
+        solution = solution_class()
+        solution.trap([3, 0, 3, 1, 5, 0, 4, 2, 4], engine="two_pointer")
+        assert [(pool["left_wall"], pool["right_wall"]) for pool in solution.pools] == [
+            (0, 2),
+            (2, 4),
+            (4, 6),
+            (6, 8),
+        ]
+
+    def test_matches_sorted_engine_pools(self, solution_class):
+        """Volume and pool breakdown match the sorted engine on random terrain."""
+        rng = random.Random(42)
+        for _ in range(500):
+            height = [rng.randint(0, 6) for _ in range(rng.randint(0, 15))]
+            reference = solution_class()
+            linear = solution_class()
+
+            expected = reference.trap(height)
+            assert linear.trap(height, engine="two_pointer") == expected
+            assert self.pool_records(linear.pools) == sorted(self.pool_records(reference.pools))
+
+    def test_float_heights(self, solution_class):
+        """Both engines accept float heights and agree on fractional terrain."""
+        for engine in ("sorted", "two_pointer"):
+            assert solution_class().trap([2.0, 0, 2.0], engine=engine) == 2.0
+        assert solution_class().trap([1, 2.5, 4.75, 2.5, 0, 3, 4.75, 0, 1, 4.75, 3, 2.5, 3]) == 17.75
+
+        rng = random.Random(7)
+        for _ in range(200):
+            height = [rng.choice([0, 0.5, 1.25, 2, 3.75]) for _ in range(rng.randint(0, 15))]
+            expected = solution_class().trap(height, engine="two_pointer")
+            assert solution_class().trap(height) == pytest.approx(expected)
+
+    def test_unknown_engine_raises(self, solution_class):
+        """An unknown engine name is rejected."""
+        with pytest.raises(ValueError):
+            solution_class().trap([1, 0, 1], engine="bogus")
+
+
+class TestTrapBatch:
+    """Test suite for the vectorized trap_batch API."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    def test_2d_array(self, solution_class):
+        """Every row of a 2D array is scored independently."""
+        heights = np.array([[4, 2, 0, 3, 2, 5], [2, 0, 2, 0, 2, 0], [0, 1, 2, 3, 4, 5]])
+        assert solution_class().trap_batch(heights).tolist() == [9, 4, 0]
+
+    def test_ragged_maps(self, solution_class):
+        """Ragged maps, including empty ones, match trap per map."""
+        maps = [[0, 1, 0, 2, 1, 0, 1, 3, 2, 1, 2, 1], [], [5], [3, 0, 0, 0, 3], [2, 0, 3]]
+        assert solution_class().trap_batch(maps).tolist() == [6, 0, 0, 9, 2]
+
+    def test_empty_batch(self, solution_class):
+        """An empty batch gives an empty result."""
+        assert solution_class().trap_batch([]).tolist() == []
+
+    def test_narrow_dtypes(self, solution_class):
+        """Narrow integer maps spanning their whole range do not wrap."""
+        volumes = solution_class().trap_batch([np.uint8([255, 0, 0]), np.uint8([0, 0, 1])])
+        assert volumes.tolist() == [0, 0]
+        volumes = solution_class().trap_batch([np.int8([127, -128, 127]), np.int8([0, -128, 127])])
+        assert volumes.tolist() == [255, 128]
+
+    def test_ragged_float_maps(self, solution_class):
+        """Tiny and huge float maps side by side keep their exact volumes."""
+        volumes = solution_class().trap_batch([[1e-9, 0, 1e-9]] * 3 + [[1e9, 0, 1e9], [1.5, 0, 2.5, 1.0]])
+        assert volumes.tolist() == [1e-9, 1e-9, 1e-9, 1e9, 1.5]
+
+    def test_ragged_large_int64_maps(self, solution_class):
+        """Heights near the int64 limit do not overflow."""
+        volumes = solution_class().trap_batch([[2 ** 62, 0, 2 ** 62], [0, 0, 0, 5]])
+        assert volumes.tolist() == [2 ** 62, 0]
+
+    def test_empty_map_keeps_integer_dtype(self, solution_class):
+        """An empty map in the list does not turn integer volumes into floats."""
+        volumes = solution_class().trap_batch([[9, 0, 9], [], [1]])
+        assert volumes.dtype.kind == "i"
+        assert volumes.tolist() == [9, 0, 0]
+
+    def test_matches_trap_on_random_maps(self, solution_class):
+        """Batched volumes match the scalar solution on random terrain."""
+        rng = random.Random(7)
+        maps = [[rng.randint(0, 9) for _ in range(rng.randint(0, 20))] for _ in range(200)]
+        expected = [solution_class().trap(height) for height in maps]
+        assert solution_class().trap_batch(maps).tolist() == expected
+
+
+class TestTrapStream:
+    """Test suite for the incremental TrapStream mode."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture(scope="class")
+    def stream_class(self):
+        """Load TrapStream class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        stream = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "TrapStream")
+        assert stream is not None, "Failed to load TrapStream class from notebook"
+        return stream
+
+    def test_running_total(self, stream_class):
+        """The running total only counts water that is already walled in."""
+        stream = stream_class()
+        assert stream.feed([0, 1, 0]) == 0
+        assert stream.feed([2, 1, 0]) == 1
+        assert stream.feed([1, 3, 2, 1, 2, 1]) == 6
+
+    def test_chunked_matches_trap(self, solution_class):
+        """Any chunking of the input gives the same volume as trap."""
+        rng = random.Random(11)
+        for _ in range(300):
+            height = [rng.randint(0, 7) for _ in range(rng.randint(0, 25))]
+            size = rng.randint(1, 6)
+            chunks = [height[i:i + size] for i in range(0, len(height), size)]
+            assert solution_class().trap_stream(chunks) == solution_class().trap(height)
+
+    def test_state_is_bounded_by_distinct_heights(self, stream_class):
+        """Only strictly decreasing candidate walls are kept."""
+        stream = stream_class()
+        stream.feed([3, 1, 2] * 1000)
+        assert len(stream.walls) <= 3
+
+    def test_from_file(self, solution_class, stream_class, tmp_path):
+        """Heights are read from a raw binary file through a memory map."""
+        height = np.array([4, 2, 0, 3, 2, 5, 0, 1, 0, 2], dtype=np.int32)
+        path = tmp_path / "heights.bin"
+        height.tofile(path)
+
+        stream = stream_class.from_file(path, dtype=np.int32, chunk_size=3)
+        assert stream.water == solution_class().trap(height.tolist())
+        assert stream.length == len(height)
+
+    def test_from_empty_file(self, stream_class, tmp_path):
+        """An empty file traps nothing."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        assert stream_class.from_file(path).water == 0
+
+
+class TestTrapRainWater2D:
+    """Test suite for the 2D heap-based flood fill."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+
+    @staticmethod
+    def relaxed_volume(grid):
+        """Reference volume: relax every inner water level until it is stable."""
+        rows, cols = len(grid), len(grid[0])
+        level = [
+            [grid[r][c] if r in (0, rows - 1) or c in (0, cols - 1) else float("inf")
+             for c in range(cols)]
+            for r in range(rows)
+        ]
+        changed = True
+        while changed:
+            changed = False
+            for r in range(1, rows - 1):
+                for c in range(1, cols - 1):
+                    lowest = min(level[r - 1][c], level[r + 1][c], level[r][c - 1], level[r][c + 1])
+                    new_level = max(grid[r][c], lowest)
+                    if new_level < level[r][c]:
+                        level[r][c] = new_level
+                        changed = True
+        return sum(level[r][c] - grid[r][c] for r in range(rows) for c in range(cols))
+
+    def test_leetcode_examples(self, solution):
+        """Both LeetCode 407 examples give the expected volume."""
+        assert solution.trapRainWater([[1, 4, 3, 1, 3, 2], [3, 2, 1, 3, 2, 4], [2, 3, 3, 2, 3, 1]]) == 4
+        assert solution.trapRainWater([
+            [3, 3, 3, 3, 3],
+            [3, 2, 2, 2, 3],
+            [3, 2, 1, 2, 3],
+            [3, 2, 2, 2, 3],
+            [3, 3, 3, 3, 3],
+        ]) == 10
+
+    def test_grids_without_inner_cells(self, solution):
+        """Grids narrower than three cells cannot hold water."""
+        assert solution.trapRainWater([]) == 0
+        assert solution.trapRainWater([[5, 0, 5]]) == 0
+        assert solution.trapRainWater([[5, 5], [0, 0], [5, 5]]) == 0
+
+    def test_matches_relaxed_levels(self, solution):
+        """The flood fill matches level relaxation on random grids."""
+        rng = random.Random(5)
+        for _ in range(100):
+            rows, cols = rng.randint(1, 6), rng.randint(1, 6)
+            grid = [[rng.randint(0, 6) for _ in range(cols)] for _ in range(rows)]
+            assert solution.trapRainWater(grid) == self.relaxed_volume(grid)
+
+    def test_grid_files(self, solution, tmp_path):
+        """Grids are read from memory-mapped .npy and raw files."""
+        grid = np.array([[3, 3, 3, 3], [3, 0, 1, 3], [3, 3, 3, 3]], dtype=np.int32)
+        np.save(tmp_path / "grid.npy", grid)
+        grid.tofile(tmp_path / "grid.bin")
+
+        assert solution.trap_grid_file(tmp_path / "grid.npy") == 5
+        assert solution.trap_grid_file(tmp_path / "grid.bin", shape=grid.shape, dtype=np.int32) == 5
+
+    def test_raw_grid_file_needs_shape(self, solution, tmp_path):
+        """A raw file without a shape is rejected instead of read as 1-D."""
+        np.zeros((3, 3), dtype=np.int32).tofile(tmp_path / "grid.bin")
+
+        with pytest.raises(ValueError):
+            solution.trap_grid_file(tmp_path / "grid.bin")
+
+    def test_rejects_non_integer_heights(self, solution):
+        """Float grids are rejected rather than truncated."""
+        with pytest.raises(TypeError):
+            solution.trapRainWater([[3, 3, 3], [3, 2.5, 3], [3, 3, 3]])
+
+
+class TestPoolRecords:
+    """Test suite for the compact block and pool representation."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    def test_pool_breakdown(self, solution_class):
+        """Pools keep their walls, depth, filled blocks and value."""
+        solution = solution_class()
+        assert solution.trap([4, 2, 0, 3, 2, 5]) == 9
+        assert len(solution.pools) == 1
+
+        pool = solution.pools[0]
+        assert (pool.index, pool.left_wall, pool.right_wall) == (5, 0, 5)
+        assert (pool.relative_depth, pool.nr_of_filled_blocks, pool.value) == (4, 7, 9)
+        assert pool.contained_indices == range(1, 5)
+
+    def test_dict_style_access(self, solution_class):
+        """Pools still support the dict-style access of the original records."""
+        solution = solution_class()
+        solution.trap([2, 0, 2])
+        pool = solution.pools[0]
+
+        assert pool["value"] == pool.value == 2
+        assert pool["contained_indices"] == range(1, 2)
+        with pytest.raises(KeyError):
+            pool["missing"]
+
+    def test_records_are_slotted(self, solution_class):
+        """Pools carry no per-instance dict."""
+        solution = solution_class()
+        solution.trap([3, 0, 1, 3])
+        assert not hasattr(solution.pools[0], "__dict__")
+
+    def test_solution_is_reusable(self, solution_class):
+        """State from a previous call does not leak into the next one."""
+        solution = solution_class()
+        assert solution.trap([5, 0, 0, 5]) == 10
+        assert solution.trap([1, 0, 1]) == 1
+        assert [(pool.left_wall, pool.right_wall) for pool in solution.pools] == [(0, 2)]
+
+
+class TestTrapSegmentTree:
+    """Test suite for point updates and range water queries."""
+
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+
+    @pytest.fixture(scope="class")
+    def tree_class(self):
+        """Load TrapSegmentTree class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("42. Trapping Rain Water.ipynb")
+        tree = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "TrapSegmentTree")
+        assert tree is not None, "Failed to load TrapSegmentTree class from notebook"
+        return tree
+
+    def test_whole_range(self, tree_class):
+        """Querying the whole map gives the trap volume."""
+        tree = tree_class([0, 1, 0, 2, 1, 0, 1, 3, 2, 1, 2, 1])
+        assert tree.water(0, 11) == 6
+
+    def test_sub_window(self, tree_class):
+        """A window only holds the water its own walls can hold."""
+        tree = tree_class([4, 2, 0, 3, 2, 5])
+        assert tree.water(0, 3) == 4
+        assert tree.water(2, 5) == 1
+        assert tree.water(1, 2) == 0
+
+    def test_update(self, tree_class):
+        """Point updates are reflected in later queries."""
+        tree = tree_class([3, 0, 0, 0, 3])
+        assert tree.water(0, 4) == 9
+        tree.update(2, 3)
+        assert tree.water(0, 4) == 6
+        tree.update(4, 0)
+        assert tree.water(0, 4) == 3
+
+    def test_matches_trap_under_random_edits(self, solution_class, tree_class):
+        """Random updates and windows match trap on the edited slice."""
+        rng = random.Random(13)
+        for _ in range(50):
+            height = [rng.randint(0, 6) for _ in range(rng.randint(1, 20))]
+            tree = tree_class(height)
+            for _ in range(20):
+                i = rng.randrange(len(height))
+                height[i] = rng.randint(0, 6)
+                tree.update(i, height[i])
+
+                l = rng.randrange(len(height))
+                r = rng.randrange(l, len(height))
+                assert tree.water(l, r) == solution_class().trap(height[l:r + 1])
+
+    def test_out_of_range_indices(self, tree_class):
+        """Indices outside the tree are rejected without touching it."""
+        tree = tree_class([3, 0, 3])
+        for i in (3, 5, -1):
+            with pytest.raises(IndexError):
+                tree.update(i, 9)
+        for l, r in ((0, 5), (-1, 2), (0, 3)):
+            with pytest.raises(IndexError):
+                tree.water(l, r)
+        assert tree.water(0, 2) == 3
+
+        with pytest.raises(IndexError):
+            tree_class([]).update(0, 1)
+
+
 # Additional test for ensuring Solution class has expected methods
 class TestSolutionStructure:
     """Test the structure and interface of Solution class."""
@@ -5,6 +5,10 @@ Tests the Solution class extracted from the Jupyter notebook.
 Validates numbers using a state machine (DFA) approach.
 """
 
+import random
+from decimal import Decimal
+
+import numpy as np
 import pytest
 from .conftest import NotebookSolutionLoader
 
@@ -206,3 +210,204 @@ class TestValidNumber:
         assert solution.isNumber(" 0.1 ") is False  # No whitespace handling
         assert solution.isNumber("2e-9") is True
         assert solution.isNumber("2e-9873") is True
+
+
+class TestCompiledTable:
+    """Test suite for the compiled byte-indexed DFA table."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("65. Vald Number.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_table_compiled_once(self, solution_class):
+        """All instances share the class-level table."""
+        assert solution_class().TABLE is solution_class().TABLE
+        assert len(solution_class.TABLE) % 256 == 0
+    
+    def test_bytes_like_inputs(self, solution):
+        """bytes, bytearray and memoryview are all accepted."""
+        assert solution.isNumber_bytes(b"-123.456e-78") is True
+        assert solution.isNumber_bytes(bytearray(b"+.5")) is True
+        assert solution.isNumber_bytes(memoryview(b"1e")) is False
+        assert solution.isNumber_bytes(b"") is False
+    
+    def test_non_ascii_rejected(self, solution):
+        """Characters outside ASCII never have a transition."""
+        assert solution.isNumber("١٢٣") is False
+        assert solution.isNumber("1é5") is False
+        assert solution.isNumber_bytes("1é5".encode("utf-8")) is False
+    
+    def test_matches_transition_dict(self, solution):
+        """The compiled table agrees with walking the transition dict."""
+        notebook_path = NotebookSolutionLoader.find_notebook("65. Vald Number.ipynb")
+        state_enum = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "State")
+        # State was redefined by loading it again; compare by name
+        transitions = {
+            (state.name, char_type.name): next_state.name
+            for (state, char_type), next_state in solution.transitions.items()
+        }
+        accepting = {state.name for state in solution.accepting_states}
+        
+        rng = random.Random(65)
+        alphabet = "0123456789+-.eE x"
+        for _ in range(2000):
+            s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            state = state_enum.START.name
+            for char in s:
+                state = transitions.get((state, solution._char_type(char).name))
+                if state is None:
+                    break
+            expected = bool(s) and state in accepting
+            assert solution.isNumber(s) is expected
+            assert solution.isNumber_bytes(s.encode("ascii")) is expected
+
+
+class TestColumnValidation:
+    """Test suite for vectorized column and CSV validation."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("65. Vald Number.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_list_of_strings(self, solution):
+        """A plain list gives one mask entry per value."""
+        mask = solution.isNumber_column(["2", "0089", "-0.1", "abc", "1e", "", "1é5", ".5e-3"])
+        assert mask.tolist() == [True, True, True, False, False, False, False, True]
+    
+    def test_bytes_array(self, solution):
+        """NumPy bytes arrays are validated without decoding."""
+        mask = solution.isNumber_column(np.array([b"+3.14", b"--6", b"53.5e93", b"e3"]))
+        assert mask.tolist() == [True, False, True, False]
+    
+    def test_empty_column(self, solution):
+        """An empty column gives an empty mask."""
+        assert solution.isNumber_column([]).tolist() == []
+    
+    def test_rejects_non_string_columns(self, solution):
+        """Numeric arrays are not columns of text."""
+        with pytest.raises(TypeError):
+            solution.isNumber_column(np.arange(3))
+    
+    def test_matches_is_number(self, solution):
+        """Lockstep validation matches isNumber row by row across blocks."""
+        rng = random.Random(14)
+        alphabet = "0123456789+-.eE x"
+        values = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9))) for _ in range(3000)]
+        expected = [solution.isNumber(value) for value in values]
+        assert solution.isNumber_column(values, block_rows=500).tolist() == expected
+    
+    def test_csv_field(self, solution, tmp_path):
+        """One field per line is located and validated, header skipped."""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"id,value,note\r\n1,3.5,x\r\n2,abc,y\r\n3,-1e9\r\n4\r\n5,,z\r\n6,7")
+        
+        mask = solution.isNumber_csv(path, column=1, skip_header=True)
+        assert mask.tolist() == [True, False, True, False, False, True]
+        assert solution.isNumber_csv(path, column=0, skip_header=True).all()
+    
+    def test_csv_blocks_and_long_fields(self, solution, tmp_path):
+        """Small blocks and fields wider than the lockstep matrix still validate."""
+        values = ["1" * 100, "1" * 99 + "x", "2.5", "x"] * 50
+        path = tmp_path / "long.csv"
+        path.write_text("\n".join(f"{i};{value}" for i, value in enumerate(values)) + "\n")
+        
+        mask = solution.isNumber_csv(path, column=1, delimiter=";", block_bytes=256)
+        assert mask.tolist() == [solution.isNumber(value) for value in values]
+    
+    def test_csv_without_delimiters(self, solution, tmp_path):
+        """Lines with no delimiter at all have only field 0."""
+        path = tmp_path / "single.csv"
+        path.write_bytes(b"1\n2\nx\n")
+        
+        assert solution.isNumber_csv(path, column=0).tolist() == [True, True, False]
+        assert solution.isNumber_csv(path, column=1).tolist() == [False, False, False]
+    
+    def test_empty_csv(self, solution, tmp_path):
+        """An empty file has no lines."""
+        path = tmp_path / "empty.csv"
+        path.write_bytes(b"")
+        assert solution.isNumber_csv(path).tolist() == []
+
+
+class TestParseNumber:
+    """Test suite for single-pass validate-and-parse."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("65. Vald Number.ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_parses_valid_numbers(self, solution):
+        """Valid numbers parse to the same float as float()."""
+        for s in ["2", "0089", "-0.1", "+3.14", "4.", "-.9", "2e10", "-90E3", "3e+7", "+6e-1", "53.5e93", "-123.456e789"]:
+            assert solution.parseNumber(s) == float(s)
+    
+    def test_invalid_returns_none(self, solution):
+        """Invalid numbers parse to None, including strings float() accepts."""
+        for s in ["", "abc", "1e", "e3", "99e2.5", "--6", "-+3", "95a54e53", "inf", "nan", " 1", "1_000", "1é5"]:
+            assert solution.parseNumber(s) is None
+    
+    def test_signed_zero(self, solution):
+        """The sign of zero is kept."""
+        assert str(solution.parseNumber("-0.0e5")) == "-0.0"
+        assert str(solution.parseNumber("0")) == "0.0"
+    
+    def test_extreme_exponents(self, solution):
+        """Overflow, underflow and rounding match float()."""
+        for s in ["1e400", "-1e400", "1e-400", "1e99999999999", "0.000001e310", "9" * 400 + "e-100",
+                  "1.7976931348623157e308", "1.7976931348623159e308", "4.9e-324", "2.4e-324", "2.5e-324"]:
+            assert solution.parseNumber(s) == float(s)
+    
+    def test_exact_mode(self, solution):
+        """Exact mode gives int for plain integers and Decimal otherwise."""
+        value = solution.parseNumber("-0089", exact=True)
+        assert value == -89 and type(value) is int
+        assert solution.parseNumber("12345678901234567890123", exact=True) == 12345678901234567890123
+        assert solution.parseNumber("-1.50", exact=True) == Decimal("-1.50")
+        assert solution.parseNumber("0.1e-2", exact=True) == Decimal("0.001")
+        assert solution.parseNumber("1.e", exact=True) is None
+    
+    def test_bytes_input(self, solution):
+        """parseNumber_bytes accepts bytes-like data."""
+        assert solution.parseNumber_bytes(b"-2.5e1") == -25.0
+        assert solution.parseNumber_bytes(memoryview(b"7")) == 7.0
+        assert solution.parseNumber_bytes(b"") is None
+    
+    def test_matches_is_number_and_float(self, solution):
+        """parseNumber agrees with isNumber and float() on random strings."""
+        rng = random.Random(15)
+        alphabet = "0123456789+-.eE"
+        for _ in range(5000):
+            s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+            value = solution.parseNumber(s)
+            if solution.isNumber(s):
+                assert value == float(s)
+                assert solution.parseNumber(s, exact=True) == Decimal(s)
+            else:
+                assert value is None
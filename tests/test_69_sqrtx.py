@@ -0,0 +1,157 @@
+"""
+Unit tests for 69. Sqrt(x) (LeetCode)
+
+Tests the Solution class extracted from the Jupyter notebook.
+Covers the Newton square root, the bisection it replaced and k-th roots.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from .conftest import NotebookSolutionLoader
+
+
+class TestSqrt:
+    """Test suite for integer square roots."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("69. Sqrt(x).ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_leetcode_examples(self, solution):
+        """Examples from the problem statement."""
+        assert solution.mySqrt(4) == 2
+        assert solution.mySqrt(8) == 2
+    
+    def test_small_values(self, solution):
+        """Both methods agree with math.isqrt on every small value."""
+        for x in range(2000):
+            assert solution.mySqrt(x) == solution.mySqrt_bisect(x) == math.isqrt(x)
+    
+    def test_perfect_squares_and_neighbours(self, solution):
+        """Values next to perfect squares round down correctly."""
+        for r in [2 ** 31 - 1, 10 ** 9 + 7, 2 ** 64 - 1, 3 ** 200]:
+            for x in (r * r - 1, r * r, r * r + 1, (r + 1) * (r + 1) - 1):
+                assert solution.mySqrt(x) == math.isqrt(x)
+    
+    def test_big_integers(self, solution):
+        """4096-bit inputs match math.isqrt."""
+        rng = random.Random(18)
+        for _ in range(50):
+            x = rng.getrandbits(4096)
+            assert solution.mySqrt(x) == math.isqrt(x)
+    
+    def test_negative_rejected(self, solution):
+        """Negative inputs have no integer square root."""
+        with pytest.raises(ValueError):
+            solution.mySqrt(-1)
+
+
+class TestKthRoot:
+    """Test suite for integer k-th roots."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("69. Sqrt(x).ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_floor_property(self, solution):
+        """r ** k <= x < (r + 1) ** k for random big inputs."""
+        rng = random.Random(18)
+        for _ in range(300):
+            k = rng.randint(1, 12)
+            x = rng.getrandbits(rng.randint(1, 2048))
+            r = solution.kthRoot(x, k)
+            assert r ** k <= x < (r + 1) ** k
+    
+    def test_exact_powers(self, solution):
+        """Exact powers and their neighbours."""
+        for k in range(2, 8):
+            for r in [2, 3, 10, 12345, 2 ** 100 + 1]:
+                assert solution.kthRoot(r ** k, k) == r
+                assert solution.kthRoot(r ** k - 1, k) == r - 1
+    
+    def test_square_root_case(self, solution):
+        """k = 2 agrees with mySqrt."""
+        for x in range(500):
+            assert solution.kthRoot(x, 2) == solution.mySqrt(x)
+    
+    def test_invalid_arguments(self, solution):
+        """k below one and negative x are rejected."""
+        with pytest.raises(ValueError):
+            solution.kthRoot(8, 0)
+        with pytest.raises(ValueError):
+            solution.kthRoot(-8, 3)
+
+
+class TestSqrtBatch:
+    """Test suite for vectorized square roots over NumPy arrays."""
+    
+    @pytest.fixture(scope="class")
+    def solution_class(self):
+        """Load Solution class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("69. Sqrt(x).ipynb")
+        solution = NotebookSolutionLoader.load_solution_from_notebook(notebook_path)
+        assert solution is not None, "Failed to load Solution class from notebook"
+        return solution
+    
+    @pytest.fixture
+    def solution(self, solution_class):
+        """Instantiate a new Solution for each test."""
+        return solution_class()
+    
+    def test_matches_scalar(self, solution):
+        """Batch results match mySqrt for small values and lists."""
+        out = solution.mySqrt_batch(list(range(1000)))
+        assert out.tolist() == [solution.mySqrt(x) for x in range(1000)]
+    
+    def test_uint64_edges_are_exact(self, solution):
+        """Squares near 2**64, where float64 rounds, are corrected exactly."""
+        r = np.arange(2 ** 32 - 500, 2 ** 32, dtype=np.uint64)
+        values = np.concatenate([r * r - np.uint64(1), r * r, r * r + np.uint64(1),
+                                 np.array([2 ** 64 - 1, 2 ** 63, 2 ** 53 + 1], dtype=np.uint64)])
+        out = solution.mySqrt_batch(values, block_size=256)
+        assert out.dtype == np.uint64
+        assert [int(v) for v in out] == [math.isqrt(int(x)) for x in values]
+    
+    def test_random_int64(self, solution):
+        """Random int64 values keep their dtype and shape."""
+        values = np.random.default_rng(19).integers(0, 2 ** 63 - 1, size=(40, 50), dtype=np.int64)
+        out = solution.mySqrt_batch(values)
+        assert out.dtype == np.int64 and out.shape == values.shape
+        assert all(int(o) == math.isqrt(int(x)) for o, x in zip(out.ravel(), values.ravel()))
+    
+    def test_invalid_input(self, solution):
+        """Negative values and non-integer arrays are rejected."""
+        with pytest.raises(ValueError):
+            solution.mySqrt_batch(np.array([4, -1]))
+        with pytest.raises(TypeError):
+            solution.mySqrt_batch(np.array([4.0]))
+    
+    def test_empty_input(self, solution):
+        """Empty input gives an empty result whatever its dtype."""
+        for empty in ([], np.array([], dtype=np.int64), np.empty((0, 3))):
+            roots = solution.mySqrt_batch(empty)
+            assert roots.dtype == np.int64
+            assert roots.shape == np.shape(empty)
+        assert solution.mySqrt_batch(np.array([], dtype=np.uint32)).dtype == np.uint64
@@ -4,6 +4,9 @@ Unit tests for Q1. Kth Largest Element in a Stream.
 Tests the KthLargest class extracted from the Jupyter notebook.
 """
 
+import random
+
+import numpy as np
 import pytest
 
 from .conftest import NotebookSolutionLoader
@@ -63,6 +66,298 @@ class TestKthLargestElementInAStream:
         assert kth_largest.add(8) == 6
 
 
+class TestAddMany:
+    """Bulk inserts and agreement with a sorted reference."""
+
+    @pytest.fixture(scope="class")
+    def kth_largest_class(self):
+        """Load KthLargest class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook(
+            "Q1. Kth Largest Element in a Stream.ipynb"
+        )
+        kth_largest = NotebookSolutionLoader.load_class_from_notebook(
+            notebook_path, "KthLargest"
+        )
+        assert kth_largest is not None, "Failed to load KthLargest class from notebook"
+        return kth_largest
+
+    def test_add_matches_sorted_reference(self, kth_largest_class):
+        """Every add returns the kth largest of everything seen so far."""
+        rng = random.Random(20)
+        nums = [rng.randint(-50, 50) for _ in range(10)]
+        kth_largest = kth_largest_class(7, nums)
+        seen = list(nums)
+
+        for _ in range(500):
+            val = rng.randint(-50, 50)
+            seen.append(val)
+            assert kth_largest.add(val) == sorted(seen)[-7]
+
+    def test_heap_keeps_only_k_scores(self, kth_largest_class):
+        """Initial values beyond the k largest are dropped."""
+        kth_largest = kth_largest_class(3, list(range(100)))
+
+        assert sorted(kth_largest.scores) == [97, 98, 99]
+        assert kth_largest.add(0) == 97
+
+    def test_add_many_matches_repeated_add(self, kth_largest_class):
+        """add_many leaves the same state as calling add for each value."""
+        rng = random.Random(21)
+        values = [rng.randint(0, 1000) for _ in range(2000)]
+        one_by_one = kth_largest_class(50, values[:20])
+        bulk = kth_largest_class(50, values[:20])
+
+        for val in values[20:]:
+            expected = one_by_one.add(val)
+
+        assert bulk.add_many(iter(values[20:])) == expected
+        assert sorted(bulk.scores) == sorted(one_by_one.scores)
+
+    def test_add_many_fills_before_cutoff(self, kth_largest_class):
+        """add_many fills a short heap and returns None when nothing was added."""
+        kth_largest = kth_largest_class(3, [])
+
+        assert kth_largest.add_many([]) is None
+        assert kth_largest.add_many([5, 1]) == 1
+        assert kth_largest.add_many([0, 9]) == 1
+        assert kth_largest.add_many([7]) == 5
+
+
+class TestWindowedKthLargest:
+    """Expiry by age and by count for the windowed variant."""
+
+    @pytest.fixture(scope="class")
+    def windowed_class(self):
+        """Load WindowedKthLargest class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook(
+            "Q1. Kth Largest Element in a Stream.ipynb"
+        )
+        windowed = NotebookSolutionLoader.load_class_from_notebook(
+            notebook_path, "WindowedKthLargest"
+        )
+        assert windowed is not None, "Failed to load WindowedKthLargest class from notebook"
+        return windowed
+
+    def test_time_window(self, windowed_class):
+        """Entries older than max_age stop counting."""
+        windowed = windowed_class(2, max_age=10)
+
+        assert windowed.add(0, 50) is None
+        assert windowed.add(1, 40) == 40
+        assert windowed.add(5, 10) == 40
+        assert windowed.add(10, 20) == 20
+        assert windowed.add(11, 5) == 10
+        assert len(windowed) == 3
+
+    def test_count_window(self, windowed_class):
+        """Only the last max_count events are live."""
+        windowed = windowed_class(1, max_count=3)
+
+        results = [windowed.add(t, value) for t, value in enumerate([9, 1, 2, 3, 8, 4])]
+
+        assert results == [9, 9, 9, 3, 8, 8]
+
+    def test_expire_without_adding(self, windowed_class):
+        """Advancing the clock alone can drop below k live entries."""
+        windowed = windowed_class(2, max_age=5)
+        windowed.add(0, 1)
+        windowed.add(3, 2)
+
+        windowed.expire(6)
+
+        assert windowed.get_cut_off_value() is None
+        assert len(windowed) == 1
+
+    def test_matches_brute_force(self, windowed_class):
+        """Random streams agree with re-sorting the live window."""
+        rng = random.Random(22)
+
+        for _ in range(50):
+            k = rng.randint(1, 5)
+            max_age = rng.randint(1, 15)
+            max_count = rng.choice([None, rng.randint(1, 25)])
+            windowed = windowed_class(k, max_age=max_age, max_count=max_count)
+            live = []
+            now = 0
+
+            for _ in range(200):
+                now += rng.randint(0, 3)
+                value = rng.randint(0, 30)
+                live = [(t, v) for t, v in live if now - t < max_age] + [(now, value)]
+                if max_count:
+                    live = live[-max_count:]
+                values = sorted(v for _, v in live)
+
+                expected = values[-k] if len(values) >= k else None
+                assert windowed.add(now, value) == expected
+
+    def test_dead_entries_stay_bounded(self, windowed_class):
+        """Heaps are compacted, so memory follows the live window."""
+        windowed = windowed_class(10, max_count=100)
+
+        for t in range(20000):
+            windowed.add(t, t % 997)
+
+        assert len(windowed.top) + len(windowed.rest) <= 2 * len(windowed) + 32
+        assert len(windowed.expired) <= len(windowed.top) + len(windowed.rest)
+
+    def test_invalid_use(self, windowed_class):
+        """A window is required and time cannot run backwards."""
+        with pytest.raises(ValueError):
+            windowed_class(1)
+
+        windowed = windowed_class(1, max_age=5)
+        windowed.add(10, 1)
+        with pytest.raises(ValueError):
+            windowed.add(9, 1)
+
+
+class TestKLLSketch:
+    """Approximate ranks and quantiles in bounded memory."""
+
+    @pytest.fixture(scope="class")
+    def sketch_class(self):
+        """Load KLLSketch class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook(
+            "Q1. Kth Largest Element in a Stream.ipynb"
+        )
+        sketch = NotebookSolutionLoader.load_class_from_notebook(
+            notebook_path, "KLLSketch"
+        )
+        assert sketch is not None, "Failed to load KLLSketch class from notebook"
+        return sketch
+
+    def test_small_streams_are_exact(self, sketch_class):
+        """Before the first compaction every value is kept."""
+        sketch = sketch_class(0.01, seed=1)
+        sketch.add_many([5, 1, 9, 3, 7])
+
+        assert sketch.kth_largest(1) == 9
+        assert sketch.kth_largest(2) == 7
+        assert sketch.quantile(0.5) == 5
+        assert sketch.rank(6) == 3
+
+    def test_rank_error_within_bound(self, sketch_class):
+        """Quantiles of a large stream land within error * n of the true rank."""
+        rng = random.Random(23)
+        values = list(range(200000))
+        rng.shuffle(values)
+        sketch = sketch_class(0.01, seed=2)
+
+        for val in values:
+            sketch.add(val)
+
+        assert len(sketch) == len(values)
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            assert abs(sketch.quantile(q) - q * len(values)) <= 0.01 * len(values)
+        assert abs(sketch.kth_largest(1000) - (len(values) - 1000)) <= 0.01 * len(values)
+
+    def test_memory_is_bounded(self, sketch_class):
+        """Stored items stay O(1 / error) however long the stream."""
+        sketch = sketch_class(0.05, seed=3)
+        sketch.add_many(range(100000))
+        stored = sketch.stored
+
+        sketch.add_many(range(100000, 400000))
+
+        assert sketch.stored <= 2 * stored
+        assert sketch.stored == sum(len(level) for level in sketch.levels)
+        assert sum(len(level) << h for h, level in enumerate(sketch.levels)) == len(sketch)
+
+    def test_invalid_arguments(self, sketch_class):
+        """Out-of-range error, quantile and k are rejected."""
+        with pytest.raises(ValueError):
+            sketch_class(0)
+
+        sketch = sketch_class(0.1)
+        assert sketch.quantile(0.5) is None
+        sketch.add(1)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+        with pytest.raises(ValueError):
+            sketch.kth_largest(2)
+
+
+class TestMergeableSummaries:
+    """Serialised top-k summaries and associative merging across shards."""
+
+    @pytest.fixture(scope="class")
+    def kth_largest_class(self):
+        """Load KthLargest class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook(
+            "Q1. Kth Largest Element in a Stream.ipynb"
+        )
+        kth_largest = NotebookSolutionLoader.load_class_from_notebook(
+            notebook_path, "KthLargest"
+        )
+        assert kth_largest is not None, "Failed to load KthLargest class from notebook"
+        return kth_largest
+
+    def test_round_trip(self, kth_largest_class):
+        """Decoding restores k and the scores, ready for further adds."""
+        kth_largest = kth_largest_class(3, [4, 5, 8, 2])
+
+        data = kth_largest.to_bytes()
+        restored = kth_largest_class.from_bytes(data)
+
+        assert isinstance(data, bytes)
+        assert restored.k == 3
+        assert sorted(restored.scores) == [4, 5, 8]
+        assert restored.add(9) == 5
+
+    def test_float_scores_round_trip(self, kth_largest_class):
+        """Non-integer scores are encoded as doubles."""
+        kth_largest = kth_largest_class(2, [0.5, 2.25, -1.0])
+
+        restored = kth_largest_class.from_bytes(kth_largest.to_bytes())
+
+        assert sorted(restored.scores) == [0.5, 2.25]
+
+    def test_large_integer_scores_round_trip(self, kth_largest_class):
+        """Integers past 2**53, numpy ones included, stay exact."""
+        kth_largest = kth_largest_class(2, [np.int64(2 ** 60 + 1), 2 ** 62 + 3, -2 ** 63])
+
+        restored = kth_largest_class.from_bytes(kth_largest.to_bytes())
+
+        assert sorted(restored.scores) == [2 ** 60 + 1, 2 ** 62 + 3]
+
+    def test_unencodable_scores_raise(self, kth_largest_class):
+        """Scores neither int64 nor float64 can hold exactly are rejected."""
+        with pytest.raises(ValueError):
+            kth_largest_class(1, [2 ** 70]).to_bytes()
+        with pytest.raises(ValueError):
+            kth_largest_class(2, [2 ** 60 + 1, 0.5]).to_bytes()
+
+    def test_merge_matches_single_stream(self, kth_largest_class):
+        """Merging shard summaries equals one KthLargest over all values."""
+        rng = random.Random(24)
+        shards = [[rng.randint(0, 10 ** 6) for _ in range(rng.randint(0, 300))] for _ in range(8)]
+        everything = [val for shard in shards for val in shard]
+
+        parts = [kth_largest_class.from_bytes(kth_largest_class(50, shard).to_bytes()) for shard in shards]
+        merged = kth_largest_class.merge(parts)
+
+        assert sorted(merged.scores) == sorted(everything)[-50:]
+        assert merged.get_cut_off_value() == sorted(everything)[-50]
+
+    def test_merge_is_associative(self, kth_largest_class):
+        """Any grouping of merges gives the same summary."""
+        rng = random.Random(25)
+        a, b, c = (kth_largest_class(20, [rng.randint(0, 100) for _ in range(40)]) for _ in range(3))
+
+        left = kth_largest_class.merge([kth_largest_class.merge([a, b]), c])
+        right = kth_largest_class.merge([a, kth_largest_class.merge([b, c])])
+
+        assert sorted(left.scores) == sorted(right.scores)
+
+    def test_merge_rejects_mixed_k(self, kth_largest_class):
+        """Summaries must agree on k, and there must be at least one."""
+        with pytest.raises(ValueError):
+            kth_largest_class.merge([kth_largest_class(2, [1]), kth_largest_class(3, [1])])
+        with pytest.raises(ValueError):
+            kth_largest_class.merge([])
+
+
 class TestKthLargestStructure:
     """Basic interface checks for the KthLargest implementation."""
 
@@ -0,0 +1,266 @@
+"""
+Unit tests for Q1. LRU Cashe.
+
+Tests the LRUCache and ShardedLRUCache classes extracted from the Jupyter notebook.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from .conftest import NotebookSolutionLoader
+
+
+class TestLRUCache:
+    """Test suite for the single-segment LRUCache."""
+
+    @pytest.fixture(scope="class")
+    def lru_cache_class(self):
+        """Load LRUCache class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("Q1. LRU Cashe.ipynb")
+        lru_cache = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "LRUCache")
+        assert lru_cache is not None, "Failed to load LRUCache class from notebook"
+        return lru_cache
+
+    def test_leetcode_example(self, lru_cache_class):
+        """Validate the LeetCode sample sequence."""
+        cache = lru_cache_class(2)
+
+        cache.put(1, 1)
+        cache.put(2, 2)
+        assert cache.get(1) == 1
+        cache.put(3, 3)
+        assert cache.get(2) == -1
+        cache.put(4, 4)
+        assert cache.get(1) == -1
+        assert cache.get(3) == 3
+        assert cache.get(4) == 4
+
+    def test_update_refreshes_recency(self, lru_cache_class):
+        """Overwriting a key makes it the most recently used."""
+        cache = lru_cache_class(2)
+
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.put(1, 10)
+        cache.put(3, 3)
+
+        assert cache.get(1) == 10
+        assert cache.get(2) == -1
+
+
+class TestWeightsAndExpiry:
+    """Test suite for byte budgets, TTL expiry and stats."""
+
+    @pytest.fixture(scope="class")
+    def lru_cache_class(self):
+        """Load LRUCache class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("Q1. LRU Cashe.ipynb")
+        lru_cache = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "LRUCache")
+        assert lru_cache is not None, "Failed to load LRUCache class from notebook"
+        return lru_cache
+
+    @pytest.fixture
+    def clock(self):
+        """A manually advanced clock."""
+        now = [0.0]
+        clock = lambda: now[0]
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    def test_byte_budget_evicts_lru(self, lru_cache_class):
+        """Entries are evicted oldest first until the bytes fit."""
+        cache = lru_cache_class(100, max_bytes=10, weigher=len)
+
+        cache.put(1, "aaaa")
+        cache.put(2, "bbbb")
+        cache.get(1)
+        cache.put(3, "cccc")
+
+        assert cache.get(2) == -1
+        assert cache.get(1) == "aaaa"
+        assert cache.bytes == 8
+        assert cache.evictions == 1
+
+    def test_oversized_value_raises(self, lru_cache_class):
+        """A value larger than the whole budget is rejected without flushing the cache."""
+        cache = lru_cache_class(100, max_bytes=10, weigher=len)
+        cache.put(1, "aaaa")
+        cache.put(2, "old")
+
+        with pytest.raises(ValueError):
+            cache.put(2, "x" * 11)
+
+        assert cache.get(1) == "aaaa"
+        assert cache.get(2) == -1
+        assert cache.bytes == 4
+
+    def test_default_weigher(self, lru_cache_class):
+        """Without a weigher, sys.getsizeof sizes each value."""
+        cache = lru_cache_class(10)
+        cache.put(1, b"x" * 1000)
+
+        assert cache.bytes == sys.getsizeof(b"x" * 1000)
+
+    def test_overwrite_updates_bytes(self, lru_cache_class):
+        """Replacing a value replaces its weight."""
+        cache = lru_cache_class(10, weigher=len)
+        cache.put(1, "abc")
+        cache.put(1, "abcdef")
+
+        assert cache.bytes == 6
+
+    def test_ttl_expires_lazily(self, lru_cache_class, clock):
+        """Expired entries are dropped on get and count as misses."""
+        cache = lru_cache_class(10, ttl=5, clock=clock)
+        cache.put(1, 1)
+        cache.put(2, 2, ttl=20)
+
+        clock.advance(5)
+
+        assert 1 in cache.cashe
+        assert cache.get(1) == -1
+        assert 1 not in cache.cashe
+        assert cache.get(2) == 2
+        assert cache.expirations == 1
+
+    def test_put_refreshes_ttl(self, lru_cache_class, clock):
+        """Writing a key again restarts its lifetime."""
+        cache = lru_cache_class(10, ttl=5, clock=clock)
+        cache.put(1, 1)
+        clock.advance(4)
+        cache.put(1, 1)
+        clock.advance(4)
+
+        assert cache.get(1) == 1
+
+    def test_stats(self, lru_cache_class):
+        """Hits, misses, evictions and bytes are reported."""
+        cache = lru_cache_class(2, weigher=lambda value: 1)
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.put(3, 3)
+        cache.get(3)
+        cache.get(1)
+
+        assert cache.stats() == {
+            "entries": 2,
+            "bytes": 2,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 1,
+            "expirations": 0,
+        }
+
+
+class TestShardedLRUCache:
+    """Test suite for the lock-striped ShardedLRUCache."""
+
+    @pytest.fixture(scope="class")
+    def sharded_class(self):
+        """Load ShardedLRUCache class from notebook."""
+        notebook_path = NotebookSolutionLoader.find_notebook("Q1. LRU Cashe.ipynb")
+        sharded = NotebookSolutionLoader.load_class_from_notebook(notebook_path, "ShardedLRUCache")
+        assert sharded is not None, "Failed to load ShardedLRUCache class from notebook"
+        return sharded
+
+    def test_capacity_split_across_segments(self, sharded_class):
+        """Segment capacities add up to the total."""
+        cache = sharded_class(100, segments=8)
+
+        assert len(cache.segments) == 8
+        assert sum(segment.capacity for segment in cache.segments) == 100
+        assert {segment.capacity for segment in cache.segments} == {12, 13}
+
+    def test_small_capacity_uses_fewer_segments(self, sharded_class):
+        """No segment is left with zero capacity."""
+        cache = sharded_class(3, segments=16)
+
+        assert len(cache.segments) == 3
+        assert all(segment.capacity == 1 for segment in cache.segments)
+
+    def test_get_and_put(self, sharded_class):
+        """Values round-trip and missing keys return -1."""
+        cache = sharded_class(64, segments=4)
+
+        for key in range(64):
+            cache.put(key, key * 2)
+
+        assert all(cache.get(key) == key * 2 for key in range(64))
+        assert cache.get(1000) == -1
+        assert len(cache) == 64
+
+    def test_eviction_within_segment(self, sharded_class):
+        """A single segment behaves like LRUCache."""
+        cache = sharded_class(2, segments=1)
+
+        cache.put(1, 1)
+        cache.put(2, 2)
+        cache.get(1)
+        cache.put(3, 3)
+
+        assert cache.get(2) == -1
+        assert cache.get(1) == 1
+
+    def test_never_exceeds_capacity_under_threads(self, sharded_class):
+        """Concurrent puts and gets keep every segment within its share."""
+        cache = sharded_class(500, segments=8)
+        errors = []
+
+        def work(offset):
+            try:
+                for i in range(5000):
+                    key = (offset * 7919 + i) % 2000
+                    cache.put(key, key)
+                    value = cache.get(key)
+                    assert value in (key, -1)
+            except AssertionError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(cache) <= 500
+        assert all(len(segment.cashe) <= segment.capacity for segment in cache.segments)
+
+    def test_byte_budget_and_stats_across_segments(self, sharded_class):
+        """The byte budget is split over segments and stats are summed."""
+        cache = sharded_class(1000, segments=4, max_bytes=103, weigher=len)
+
+        assert sum(segment.max_bytes for segment in cache.segments) == 103
+        for key in range(100):
+            cache.put(key, "x" * 10)
+        for key in range(100):
+            cache.get(key)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 103
+        assert stats["entries"] == len(cache)
+        assert stats["hits"] + stats["misses"] == 100
+        assert stats["evictions"] == 100 - len(cache)
+
+    def test_value_larger_than_segment_budget_is_rejected(self, sharded_class):
+        """A value that cannot fit its segment raises instead of vanishing."""
+        cache = sharded_class(1000, segments=16, max_bytes=1600, weigher=len)
+        cache.put(1, "x" * 50)
+
+        with pytest.raises(ValueError):
+            cache.put(1, "x" * 150)
+
+        assert cache.get(1) == -1
+
+    def test_segments_sized_for_largest_value(self, sharded_class):
+        """max_value_bytes trades segments for a budget every value fits."""
+        cache = sharded_class(1000, segments=16, max_bytes=1600, max_value_bytes=150, weigher=len)
+
+        assert len(cache.segments) == 10
+        assert all(segment.max_bytes >= 150 for segment in cache.segments)
+        for key in range(20):
+            cache.put(key, "x" * 150)
+            assert cache.get(key) == "x" * 150
+        assert cache.stats()["bytes"] <= 1600